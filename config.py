@@ -8,10 +8,19 @@ BASE_DIR = Path(__file__).parent
 # Database configuration
 DB_NAME = "todos.db"
 DB_PATH = str(BASE_DIR / DB_NAME)
+# Number of SQLite connections kept open and reused
+DB_POOL_SIZE = 4
+# Writes between PRAGMA optimize runs
+DB_OPTIMIZE_INTERVAL = 1000
 
 # Default project name for new tasks
 DEFAULT_PROJECT = "Inbox"
 
+# Seconds the task list cursor has to rest before the task details follow it
+HIGHLIGHT_DEBOUNCE = 0.03
+# Seconds of typing pause before an edited task is saved
+AUTOSAVE_DEBOUNCE = 0.2
+
 # Date format for due dates
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -34,5 +43,5 @@ class Priority(str):
 
 # Database schema versions
 class SchemaVersion:
-    CURRENT = 1
+    CURRENT = 2
     MIN_SUPPORTED = 1
@@ -1,23 +1,124 @@
 """Database connection and initialization."""
 
+import atexit
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
-from config import DB_PATH, DEFAULT_PROJECT, SchemaVersion
+from config import (
+    DB_OPTIMIZE_INTERVAL,
+    DB_PATH,
+    DB_POOL_SIZE,
+    DEFAULT_PROJECT,
+    SchemaVersion,
+)
+
+# Per-connection settings applied every time a connection is opened
+CONNECTION_PRAGMAS = (
+    "foreign_keys = ON",
+    "synchronous = NORMAL",
+    "temp_store = MEMORY",
+    "cache_size = -65536",
+    "mmap_size = 268435456",
+)
+
+# UPDATE/DELETE ... RETURNING needs SQLite 3.35+
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Indexes on tasks, added in schema version 2. idx_tasks_sort matches the task
+# list ORDER BY so loads read rows in order instead of sorting them.
+INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
+    CREATE INDEX IF NOT EXISTS idx_tasks_sort ON tasks(completed, due_date, created_at);
+"""
+
+
+def _fts_trigram_available() -> bool:
+    """Check whether this SQLite build has FTS5 with the trigram tokenizer (3.34+)."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text, tokenize = 'trigram')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+SUPPORTS_FTS = _fts_trigram_available()
+
+# Full-text index over task titles and descriptions, kept in sync by triggers.
+# The trigram tokenizer matches any substring of 3+ characters, so MATCH gives
+# the same results as LIKE '%q%' without scanning every row. Saves rewrite the
+# title and description even when only the due date changed, so the update
+# trigger re-indexes only when one of them differs.
+FTS_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content = 'tasks', content_rowid = 'id', tokenize = 'trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks
+    WHEN old.title IS NOT new.title OR old.description IS NOT new.description BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;
+"""
+
+# Tables created on first boot
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS projects (
+        id INTEGER PRIMARY KEY,
+        name TEXT UNIQUE NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        description TEXT,
+        completed BOOLEAN NOT NULL DEFAULT 0,
+        priority TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        modified_at TEXT NOT NULL,
+        due_date TEXT,
+        project_id INTEGER NOT NULL,
+        FOREIGN KEY(project_id) REFERENCES projects(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY
+    );
+"""
 
 
 class DatabaseConnection:
     """Handles database connections and schema management."""
 
-    def __init__(self, path: str = DB_PATH):
+    def __init__(self, path: str = DB_PATH, pool_size: int = DB_POOL_SIZE):
         """Initialize database connection.
 
         Args:
             path: Path to the SQLite database file
+            pool_size: Number of connections kept open for reuse
         """
         self.path = path
+        self.pool_size = pool_size
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=pool_size)
+        self._writes = 0
         self._ensure_db_directory()
+        self._populate_pool()
         self._init_schema()
 
     def _ensure_db_directory(self) -> None:
@@ -26,45 +127,46 @@ class DatabaseConnection:
         if db_path.parent:
             db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _populate_pool(self) -> None:
+        """Open the pooled connections up front so later calls never pay for connect()."""
+        for _ in range(self.pool_size):
+            self._pool.put(self.get_connection())
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection for the duration of a transaction.
+
+        The transaction is committed when the block exits normally and rolled
+        back if it raises. The connection is returned to the pool either way.
+
+        Yields:
+            sqlite3.Connection: Database connection
+        """
+        conn = self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
     def _init_schema(self) -> None:
         """Initialize database schema if it doesn't exist."""
-        with self.get_connection() as conn:
-            # Create projects table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS projects (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT UNIQUE NOT NULL
-                )
-            """)
-
-            # Create tasks table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    completed BOOLEAN NOT NULL DEFAULT 0,
-                    priority TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    modified_at TEXT NOT NULL,
-                    due_date TEXT,
-                    project_id INTEGER NOT NULL,
-                    FOREIGN KEY(project_id) REFERENCES projects(id)
-                )
-            """)
-
-            # Create schema version table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version INTEGER PRIMARY KEY
-                )
-            """)
+        with self.connection() as conn:
+            # WAL is persistent in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode = WAL")
 
-            # Check current schema version
-            cursor = conn.execute("SELECT version FROM schema_version LIMIT 1")
-            current_version = cursor.fetchone()
+            # An existing database already has its tables, so skip straight to the version check
+            cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'")
+            if cursor.fetchone() is None:
+                conn.executescript(SCHEMA_SQL + INDEX_SQL)
+                current_version = None
+            else:
+                cursor = conn.execute("SELECT version FROM schema_version LIMIT 1")
+                current_version = cursor.fetchone()
 
             if current_version is None:
+                # DDL runs in autocommit; seed the new database in one explicit transaction
+                conn.execute("BEGIN IMMEDIATE")
                 # New database, set initial version
                 conn.execute(
                     "INSERT INTO schema_version (version) VALUES (?)",
@@ -75,10 +177,60 @@ class DatabaseConnection:
                     "INSERT OR IGNORE INTO projects (name) VALUES (?)",
                     (DEFAULT_PROJECT,),
                 )
+                conn.commit()
             else:
                 # Database exists, run migrations if needed
                 self._run_migrations(conn, current_version["version"])
 
+            if SUPPORTS_FTS:
+                self._ensure_fts(conn)
+            else:
+                self._drop_fts(conn)
+
+    def _ensure_fts(self, conn: sqlite3.Connection) -> None:
+        """Create the task search index and its triggers where the database lacks them.
+
+        Checked on every start rather than tied to a schema version, since the
+        same file may be opened by SQLite builds with and without FTS5; see
+        `_drop_fts` for the latter.
+
+        Args:
+            conn: Database connection
+        """
+        cursor = conn.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name IN (?, ?, ?, ?)",
+            ("tasks_fts", "tasks_fts_insert", "tasks_fts_delete", "tasks_fts_update"),
+        )
+        # Everything is in place on a normal start, so skip the DDL
+        if cursor.fetchone()[0] == 4:
+            return
+        conn.executescript(FTS_SQL)
+        # Index the tasks written while the table or its triggers were missing
+        conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+    def _drop_fts(self, conn: sqlite3.Connection) -> None:
+        """Remove the task search triggers on a SQLite build without FTS5.
+
+        The triggers write to tasks_fts, so while they exist every change to
+        tasks fails with "no such module: fts5". The search index goes stale
+        without them and is rebuilt by `_ensure_fts` once FTS5 is available again.
+
+        Args:
+            conn: Database connection
+        """
+        conn.executescript(
+            """
+            DROP TRIGGER IF EXISTS tasks_fts_insert;
+            DROP TRIGGER IF EXISTS tasks_fts_delete;
+            DROP TRIGGER IF EXISTS tasks_fts_update;
+            """
+        )
+        try:
+            conn.execute("DROP TABLE IF EXISTS tasks_fts")
+        except sqlite3.OperationalError:
+            # Dropping a virtual table needs its module; the stale table is left for the rebuild
+            pass
+
     def _run_migrations(self, conn: sqlite3.Connection, current_version: int) -> None:
         """Run database migrations if needed.
 
@@ -86,43 +238,102 @@ class DatabaseConnection:
             conn: Database connection
             current_version: Current schema version
         """
-        # Example migration (add more as needed):
-        # if current_version < 2:
-        #     # Migration code for version 2
-        #     pass
-        #
+        if current_version < 2:
+            # The search table and its triggers are added by _ensure_fts on every start
+            conn.executescript(INDEX_SQL)
+
         # Update schema version
         conn.execute("UPDATE schema_version SET version = ?", (SchemaVersion.CURRENT,))
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory set to return dicts.
+        """Open a new database connection with rows returned as `sqlite3.Row`.
+
+        Most callers should borrow a pooled connection via `connection()` instead.
 
         Returns:
             sqlite3.Connection: Database connection
         """
 
-        def dict_factory(cursor, row):
-            return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
-
-        conn = sqlite3.connect(self.path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON")
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
         return conn
 
-    def execute(self, query: str, params: Tuple[Any, ...] = ()) -> sqlite3.Cursor:
-        """Execute a query and return the cursor.
+    def execute(self, query: str, params: Tuple[Any, ...] = ()) -> Tuple[Optional[int], int]:
+        """Execute a write query.
+
+        The connection goes back to the pool before this returns, so only the
+        cursor's counters are handed out; use `fetch_all`/`fetch_one` for rows.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+
+        Returns:
+            Tuple of the last inserted row id and the number of rows changed
+        """
+        with self.connection() as conn:
+            cursor = conn.execute(query, params)
+            result = cursor.lastrowid, cursor.rowcount
+        self._count_write()
+        return result
+
+    def execute_many(self, query: str, params_seq: Iterable[Tuple[Any, ...]]) -> int:
+        """Execute a query once per parameter tuple in a single transaction.
 
         Args:
             query: SQL query
+            params_seq: Parameters for each execution
+
+        Returns:
+            Total number of rows modified
+        """
+        with self.connection() as conn:
+            cursor = conn.executemany(query, params_seq)
+        self._count_write()
+        return cursor.rowcount
+
+    def execute_returning(self, query: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
+        """Execute a write with a RETURNING clause and fetch the returned row.
+
+        Requires `SUPPORTS_RETURNING`.
+
+        Args:
+            query: SQL query ending in a RETURNING clause
             params: Query parameters
 
         Returns:
-            sqlite3.Cursor: Cursor with results
+            The first returned row, or None if no row was written
         """
-        with self.get_connection() as conn:
-            return conn.execute(query, params)
+        with self.connection() as conn:
+            # Step the statement to completion before the transaction commits
+            rows = conn.execute(query, params).fetchall()
+        self._count_write()
+        return rows[0] if rows else None
+
+    def _count_write(self) -> None:
+        """Refresh planner statistics now and then during long sessions."""
+        self._writes += 1
+        if self._writes % DB_OPTIMIZE_INTERVAL == 0:
+            self.optimize()
+
+    def optimize(self) -> None:
+        """Let SQLite refresh the query planner statistics it finds stale."""
+        with self.connection() as conn:
+            conn.execute("PRAGMA optimize")
 
-    def fetch_all(self, query: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Optimize and close every pooled connection."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.execute("PRAGMA optimize")
+            conn.close()
+
+    def fetch_all(self, query: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
         """Execute a query and fetch all results.
 
         Args:
@@ -130,13 +341,13 @@ class DatabaseConnection:
             params: Query parameters
 
         Returns:
-            List of result rows as dictionaries
+            List of result rows, accessible by column name
         """
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchall()
 
-    def fetch_one(self, query: str, params: Tuple[Any, ...] = ()) -> Optional[Dict[str, Any]]:
+    def fetch_one(self, query: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
         """Execute a query and fetch one result.
 
         Args:
@@ -144,12 +355,30 @@ class DatabaseConnection:
             params: Query parameters
 
         Returns:
-            Single result row as dictionary or None if no results
+            Single result row, accessible by column name, or None if no results
         """
-        with self.get_connection() as conn:
+        with self.connection() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchone()
 
 
-# Global database connection instance
-db = DatabaseConnection()
+# Global database connection instance, created on first use
+_db: Optional[DatabaseConnection] = None
+# Guards the creation of _db; the first call may come from a worker thread
+_db_lock = threading.Lock()
+
+
+def get_db() -> DatabaseConnection:
+    """Return the shared database connection, creating it on first use.
+
+    Returns:
+        DatabaseConnection: Shared database connection
+    """
+    global _db
+    if _db is None:
+        with _db_lock:
+            # Another thread may have created it while this one waited
+            if _db is None:
+                _db = DatabaseConnection()
+                atexit.register(_db.close)
+    return _db
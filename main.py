@@ -3,8 +3,11 @@ from typing import Optional
 from textual import on
 from textual.app import App, ComposeResult
 from textual.message import Message
-from textual.widgets import Footer, Header
+from textual.timer import Timer
+from textual.widgets import DataTable, Footer, Header
+from textual.worker import Worker
 
+from config import HIGHLIGHT_DEBOUNCE
 from models import TaskStore
 from ui import (
     DeleteConfirmDialog,
@@ -26,12 +29,15 @@ class TodoApp(App):
         ("d", "delete_task", "Delete Task"),
         ("c", "complete_task", "Complete Task"),
         ("s", "settings", "Settings"),
+        ("r", "refresh", "Refresh"),
         ("q", "quit", "Quit"),
     ]
 
     class ThemeChangedMessage(Message):
         """Message sent when the theme changes."""
 
+        __slots__ = ("theme",)
+
         def __init__(self, theme: str):
             self.theme = theme
             super().__init__()
@@ -40,37 +46,71 @@ class TodoApp(App):
         super().__init__()
         self.task_store = TaskStore()
         self.tasks = []
+        # Maps task id -> position in self.tasks (and row in the task table)
+        self._task_index: dict[int, int] = {}
+        # Ids of tasks toggled since the last completion write; an id toggled
+        # twice drops out again, see action_complete_task
+        self._pending_toggles: set[int] = set()
+        # Worker writing the pending toggles, and whether it is still draining them
+        self._toggle_writer: Optional[Worker] = None
+        self._writing_toggles = False
+        # Pending TaskView update for the highlighted row, see handle_row_highlighted
+        self._highlight_timer: Optional[Timer] = None
 
     async def on_mount(self) -> None:
         """Initialize the app and load tasks."""
         self.title = "Textual Todos"
         self.sub_title = "A simple Todo app in your terminal"
         """Load tasks when the app starts."""
-        self.tasks = await self.task_store.load()
-        self.update_list()
+        # Paint the layout first and fill in the tasks once they are loaded
+        self.run_worker(self.action_refresh(), exclusive=True)
+
+    async def action_refresh(self) -> None:
+        """Reload every task from the database and rebuild the list.
+
+        Mutations patch `self.tasks` in place, so this is only needed on mount
+        or to restore the sorted order on request. The table is left untouched
+        when the reloaded tasks match the ones already shown.
+        """
+        task_list = self._task_list
+        selected_id = task_list.get_selected_task_id()
+        await self._wait_for_toggles()
+        task_list.loading = True
+        try:
+            tasks = await self.task_store.load()
+        finally:
+            task_list.loading = False
+        # Nothing changed since the last load, so keep the rows (and cursor) as they are
+        if tasks and tasks == self.tasks:
+            return
+        self.tasks = tasks
+        self._reindex_tasks()
+        # Stay on the selected task even if the reload moved it
+        self.update_list(selected_id)
 
     def update_list(self, focus_task_id: Optional[int] = None):
         """Refresh the task list with current tasks.
 
+        Rebuilds every row, so mutations should prefer the targeted
+        `TaskList.update_row`/`append_row`/`remove_row` updates.
+
         Args:
             focus_task_id: Optional task ID to focus after update
         """
-        task_list = self.query_one(TaskList)
-        task_view = self.query_one(TaskView)
+        task_list = self._task_list
+        task_view = self._task_view
 
         # Update the task list
         task_list.update_table(self.tasks, focus_task_id)
 
-        # If we have tasks but none is selected, select the first one
-        if self.tasks and focus_task_id is None:
+        # Keep showing the focused task if it is still there, otherwise the
+        # first one; the view is only cleared when no tasks are left
+        idx = self._task_index.get(focus_task_id) if focus_task_id is not None else None
+        if idx is not None:
+            task_view.update_task(self.tasks[idx])
+        elif self.tasks:
             task_view.update_task(self.tasks[0])
-        # If we have a specific task to focus
-        elif focus_task_id is not None:
-            task = next((t for t in self.tasks if t["id"] == focus_task_id), None)
-            if task:
-                task_view.update_task(task)
-        # No tasks
-        elif not self.tasks:
+        else:
             task_view.update_task(None)
 
         # Ensure the task list has focus by default if not editing
@@ -80,117 +120,159 @@ class TodoApp(App):
     @on(TaskList.Selected)
     def handle_task_selected(self, event: TaskList.Selected) -> None:
         """Handle task selection in the task list."""
-        task_view = self.query_one(TaskView)
+        task_view = self._task_view
         task_view.update_task(event.task)
         # Keep focus on the task list unless we're in edit mode
         if not task_view._is_editing:
-            self.query_one(TaskList).focus()
+            self._task_list.focus()
+
+    @on(DataTable.RowHighlighted)
+    def handle_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Update TaskView when the row highlight (cursor) changes in the DataTable.
 
-    @on("data_table.row_highlighted")
-    def handle_row_highlighted(self, event) -> None:
-        """Update TaskView when the row highlight (cursor) changes in the DataTable."""
-        task_view = self.query_one(TaskView)
+        Holding an arrow key highlights a burst of rows, so the update is
+        deferred until the cursor has rested for `HIGHLIGHT_DEBOUNCE` seconds.
+        """
+        if self._highlight_timer is not None:
+            self._highlight_timer.stop()
+        self._highlight_timer = self.set_timer(HIGHLIGHT_DEBOUNCE, self._show_highlighted_task)
+
+    def _show_highlighted_task(self) -> None:
+        """Show the task under the cursor once highlighting has settled."""
+        self._highlight_timer = None
         # Only update if we're not currently editing
-        if not task_view._is_editing:
-            # Find the TaskList and DataTable
-            task_list = self.query_one(TaskList)
-            table = task_list.query_one("#task-table")
-            row_idx = table.cursor_row
-            if row_idx is not None and 0 <= row_idx < len(self.tasks):
-                task_view.update_task(self.tasks[row_idx])
+        if not self._task_view._is_editing:
+            task = self._task_list.get_selected_task()
+            if task is not None:
+                self._show_task(task)
 
     def action_add_task(self):
         """Focus TaskView for adding a new task."""
-        task_view = self.query_one(TaskView)
-        task_list = self.query_one(TaskList)
-
-        # Clear and focus the task view for new task
-        task_view.clear_and_focus()
+        # Clear and focus the task view for new task; the table is left as is
+        # and the new row is appended once the task is saved
+        self._task_view.clear_and_focus()
 
-        # If there are no tasks, ensure the task list is in a good state
-        if not self.tasks:
-            task_list.update_table([])
-
-        # The task view will take focus in clear_and_focus()
+    def action_complete_task(self):
+        """Toggle completion for selected task.
 
-    async def action_complete_task(self):
-        """Toggle completion for selected task."""
-        task_list = self.query_one(TaskList)
+        The row flips right away, while the write is left to `_write_toggles`,
+        so presses that arrive while a write is in flight share the next one.
+        """
+        task_list = self._task_list
         selected_task = task_list.get_selected_task()
         if selected_task:
             task_id = selected_task["id"]
-            await self.task_store.toggle_completion(task_id)
-            self.tasks = await self.task_store.load()
-            self.update_list()
+            # Redraw just the toggled row instead of reloading every task
+            task = selected_task | {"completed": not selected_task["completed"]}
+            idx = self._task_index[task_id]
+            self.tasks[idx] = task
+            task_list.update_row(idx, task)
+            self._show_task(task)
+
+            # Only the parity of the presses matters: a second toggle cancels the first
+            self._pending_toggles ^= {task_id}
+            if not self._writing_toggles:
+                self._writing_toggles = True
+                self._toggle_writer = self.run_worker(self._write_toggles(), group="toggles")
+
+    async def _write_toggles(self) -> None:
+        """Write the pending completion toggles, one transaction per batch."""
+        failed = False
+        while self._pending_toggles:
+            task_ids = list(self._pending_toggles)
+            self._pending_toggles.clear()
+            if await self.task_store.bulk_toggle(task_ids) != len(task_ids):
+                failed = True
+        self._writing_toggles = False
+
+        if failed:
+            self.notify("Failed to update task!", severity="error", timeout=3)
+            # Reload so the rows show what is actually stored
+            self.run_worker(self.action_refresh(), exclusive=True)
+        else:
             self.notify("Task updated!", timeout=3)
 
+    async def _wait_for_toggles(self) -> None:
+        """Wait until pending completion toggles are written, before another write or a reload."""
+        if self._writing_toggles and self._toggle_writer is not None:
+            await self._toggle_writer.wait()
+
+    def _reindex_tasks(self) -> None:
+        """Rebuild the task id -> index map after `self.tasks` is replaced or reordered."""
+        self._task_index = {t["id"]: i for i, t in enumerate(self.tasks)}
+
+    def _show_task(self, task: Optional[dict]) -> None:
+        """Show a task in the TaskView, keeping focus on the task list unless editing.
+
+        Args:
+            task: Task to display, or None to clear the view
+        """
+        task_view = self._task_view
+        task_view.update_task(task)
+        if not task_view._is_editing:
+            self._task_list.focus()
+
     def compose(self) -> ComposeResult:
         """Layout of the app."""
         yield Header()
+        # Keep references so handlers don't have to query the DOM
+        self._task_list = TaskList()
+        self._task_view = TaskView()
         yield ProjectList()
-        yield TaskList()
-        yield TaskView()
+        yield self._task_list
+        yield self._task_view
         yield Footer()
 
     @on(TaskView.Save)
     async def handle_taskview_save(self, event: TaskView.Save):
+        task = event.task
+        # Read the shared fields once; TaskView sends None for an empty description
+        title = task["title"]
+        description = task.get("description") or ""
+        due_date = task.get("due_date")
         # If there is no id, this is a new task
-        if not event.task.get("id"):
+        task_id = task.get("id")
+        is_new = not task_id
+        # The update returns the stored row, so let pending toggles land first
+        await self._wait_for_toggles()
+        if is_new:
             # Create new task
             result = await self.task_store.add_task(
-                event.task["title"],
-                event.task.get("description") or "",
-                priority=event.task.get("priority", "medium"),
-                due_date=event.task.get("due_date"),
-                project=event.task.get("project_name", "Inbox"),
+                title,
+                description,
+                priority=task.get("priority", "medium"),
+                due_date=due_date,
+                project=task.get("project_name", "Inbox"),
             )
-            if "error" in result:
-                self.notify(result["error"], severity="error", timeout=3)
-                return
-
-            # Reload tasks and update the list, focusing on the new task
-            self.tasks = await self.task_store.load()
-            self.update_list(focus_task_id=result["id"])
-
-            # Notify user
-            self.notify("Task created!", timeout=2)
-
-            # Focus the task list after a short delay
-            def focus_task_list():
-                task_list = self.query_one(TaskList)
-                task_list.focus()
-
-            self.set_timer(0.1, focus_task_list)
         else:
             # Update existing task
-            task_id = event.task["id"]
-            result = await self.task_store.update_task(
-                task_id,
-                event.task["title"],
-                event.task["description"],
-                due_date=event.task.get("due_date"),
-            )
-            if "error" in result:
-                self.notify(result["error"], severity="error", timeout=3)
-                return
-
-            # Reload tasks and update the list, maintaining focus on the updated task
-            self.tasks = await self.task_store.load()
-            self.update_list(focus_task_id=task_id)
+            result = await self.task_store.update_task(task_id, title, description, due_date=due_date)
+        if "error" in result:
+            self.notify(result["error"], severity="error", timeout=3)
+            return
 
-            # Notify user
-            self.notify("Task updated!", timeout=2)
+        task_list = self._task_list
+        if is_new:
+            # Add a row for the new task and move the cursor to it
+            self._task_index[result["id"]] = len(self.tasks)
+            self.tasks.append(result)
+            task_list.append_row(result)
+        else:
+            # Redraw just the updated row, keeping the cursor on it
+            idx = self._task_index[result["id"]]
+            self.tasks[idx] = result
+            task_list.update_row(idx, result)
+        self._show_task(result)
 
-            # Focus the task list after a short delay
-            def focus_task_list():
-                task_list = self.query_one(TaskList)
-                task_list.focus()
+        # Notify user
+        self.notify("Task created!" if is_new else "Task updated!", timeout=2)
 
-            self.set_timer(0.1, focus_task_list)
+        # Focus the task list once the pending updates have been painted
+        self.call_after_refresh(task_list.focus)
 
     async def action_delete_task(self):
         """Handle task deletion flow."""
-        task_list = self.query_one(TaskList)
+        task_list = self._task_list
         selected_task = task_list.get_selected_task()
 
         if not selected_task:
@@ -208,10 +290,17 @@ class TodoApp(App):
     @on(DeleteConfirmDialog.Delete)
     async def handle_delete(self, message: DeleteConfirmDialog.Delete):
         """Handle the deletion of a task."""
+        await self._wait_for_toggles()
         success = await self.task_store.delete_task(message.task_id)
         if success:
-            self.tasks = await self.task_store.load()
-            self.update_list()
+            task_list = self._task_list
+            idx = self._task_index.pop(message.task_id)
+            del self.tasks[idx]
+            # Only the rows below the deleted one move up
+            for task in self.tasks[idx:]:
+                self._task_index[task["id"]] -= 1
+            task_list.remove_row(message.task_id)
+            self._show_task(task_list.get_selected_task())
             self.notify("Task deleted!", timeout=3)
         else:
             self.notify("Failed to delete task!", severity="error", timeout=3)
@@ -224,6 +313,10 @@ class TodoApp(App):
     def handle_theme_changed(self, event: ThemeChanged) -> None:
         """Handle theme change event from settings dialog."""
         theme = event.theme
+        # App.theme already ignores an unchanged value; this only skips the
+        # ThemeChangedMessage and notification for a theme that is already applied
+        if theme == self.theme:
+            return
         # Apply the selected theme
         self.theme = theme
         # Post a message about the theme change
@@ -1,8 +1,65 @@
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+import asyncio
+import re
+import sqlite3
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from config import DATE_FORMAT, MAX_DESCRIPTION_LENGTH, MAX_TITLE_LENGTH, Priority
-from database import db
+from database import SUPPORTS_FTS, SUPPORTS_RETURNING, get_db
+
+# Hand-written for DATE_FORMAT, whose groups validate_task passes to date(year,
+# month, day) in that order, so a different format must come with a new pattern.
+# The calendar check is left to datetime.date
+if DATE_FORMAT != "%Y-%m-%d":
+    raise RuntimeError(f"_DUE_DATE_RE only parses %Y-%m-%d due dates, not DATE_FORMAT {DATE_FORMAT!r}")
+_DUE_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+# Hot-path queries. Keeping the text identical between calls lets each
+# connection's statement cache reuse the compiled statement.
+# Task lists skip the projects JOIN; names are matched by id in _fetch_tasks
+_SELECT_TASKS_SQL = "SELECT * FROM tasks"
+_TASK_ORDER_SQL = "ORDER BY completed, due_date, created_at"
+_LOAD_TASKS_SQL = f"{_SELECT_TASKS_SQL} {_TASK_ORDER_SQL}"
+_GET_TASK_SQL = """
+    SELECT tasks.*, projects.name AS project_name
+    FROM tasks
+    JOIN projects ON tasks.project_id = projects.id
+    WHERE tasks.id = ?
+"""
+_PROJECT_NAMES_SQL = "SELECT id, name FROM projects"
+_GET_PROJECT_ID_SQL = "SELECT id FROM projects WHERE name = ?"
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks (
+        title, description, completed, priority,
+        created_at, modified_at, due_date, project_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_UPDATE_TASK_SQL = """
+    UPDATE tasks
+    SET title=?, description=?, due_date=?, modified_at=?,
+        priority=COALESCE(?, priority), project_id=COALESCE(?, project_id)
+    WHERE id=?
+"""
+_TOGGLE_COMPLETED_SQL = "UPDATE tasks SET completed = NOT completed, modified_at = ? WHERE id = ?"
+# Appended to single-task writes so they return the task in the same round trip
+_RETURNING_TASK_SQL = """
+    RETURNING *, (SELECT name FROM projects WHERE projects.id = tasks.project_id) AS project_name
+"""
+_DELETE_TASK_SQL = "DELETE FROM tasks WHERE id=?"
+
+
+@lru_cache(maxsize=None)
+def _returning_sql(query: str) -> str:
+    """Append `_RETURNING_TASK_SQL` to a single-task write, built once per statement."""
+    return f"{query} {_RETURNING_TASK_SQL}"
+
+
+@lru_cache(maxsize=None)
+def _search_sql(conditions: Tuple[str, ...]) -> str:
+    """Build the search query for a combination of filter conditions, once per combination."""
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"{_SELECT_TASKS_SQL} {where_clause} {_TASK_ORDER_SQL}"
 
 
 class TaskValidationError(Exception):
@@ -26,8 +83,12 @@ class ProjectNotFoundError(Exception):
 class TaskStore:
     """Handles task-related database operations."""
 
+    def __init__(self):
+        # Project name -> id, see _get_project_id
+        self._project_ids: Dict[str, int] = {}
+
     @staticmethod
-    def _format_task(row: Dict) -> Dict:
+    def _format_task(row: sqlite3.Row) -> Dict:
         """Format task data from database row to dict."""
         return {
             "id": row["id"],
@@ -39,9 +100,50 @@ class TaskStore:
             "modified_at": row["modified_at"],
             "due_date": row["due_date"],
             "project_id": row["project_id"],
-            "project_name": row.get("project_name", ""),
+            "project_name": row["project_name"] if "project_name" in row.keys() else "",
         }
 
+    @staticmethod
+    def _format_tasks(rows: Iterable[Sequence], columns: List[str], project_names: Dict[int, str]) -> List[Dict]:
+        """Format a batch of task rows to dicts.
+
+        Same result as `_format_task` per row, but the column names are read
+        once for the whole result set rather than looked up row by row.
+
+        Args:
+            rows: Rows from the tasks table, e.g. a cursor still being read
+            columns: Column names of the rows
+            project_names: Project id -> name, used to fill in `project_name`
+        """
+        tasks = [dict(zip(columns, row)) for row in rows]
+        for task in tasks:
+            task["description"] = task["description"] or ""
+            task["completed"] = bool(task["completed"])
+            task["project_name"] = project_names.get(task["project_id"], "")
+        return tasks
+
+    def _fetch_tasks(self, query: str, params: Tuple[Any, ...] = ()) -> List[Dict]:
+        """Run a query over the tasks table and format the resulting tasks.
+
+        The handful of projects is read once and matched by id, rather than
+        joining every task row against the projects table. Task rows are
+        turned into dicts as the cursor is read, without a `fetchall()` copy.
+
+        Args:
+            query: SQL query selecting rows from tasks
+            params: Query parameters
+
+        Returns:
+            List of tasks as dictionaries
+        """
+        with get_db().connection() as conn:
+            project_names = dict(conn.execute(_PROJECT_NAMES_SQL).fetchall())
+            cursor = conn.execute(query, params)
+            # Plain tuples are enough since the names are zipped in anyway
+            cursor.row_factory = None
+            columns = [column[0] for column in cursor.description]
+            return self._format_tasks(cursor, columns, project_names)
+
     @staticmethod
     def validate_task(title: str, description: str = "", due_date: Optional[str] = None) -> Optional[str]:
         """Validate task data.
@@ -63,8 +165,12 @@ class TaskStore:
         if len(description) > MAX_DESCRIPTION_LENGTH:
             return f"Description cannot exceed {MAX_DESCRIPTION_LENGTH} characters"
         if due_date:
+            # Same dates strptime(due_date, DATE_FORMAT) accepts, without its format parsing
+            match = _DUE_DATE_RE.fullmatch(due_date)
             try:
-                datetime.strptime(due_date, DATE_FORMAT)
+                if match is None:
+                    raise ValueError
+                date(*map(int, match.groups()))
             except ValueError:
                 return f"Due date must be in {DATE_FORMAT} format"
         return None
@@ -75,18 +181,15 @@ class TaskStore:
         Returns:
             List of tasks as dictionaries
         """
-        query = """
-            SELECT tasks.*, projects.name AS project_name
-            FROM tasks
-            JOIN projects ON tasks.project_id = projects.id
-            ORDER BY tasks.completed, tasks.due_date, tasks.created_at
-        """
-        rows = db.fetch_all(query)
-        return [self._format_task(row) for row in rows]
+        # Run the query in a worker thread so the UI stays responsive
+        return await asyncio.to_thread(self._fetch_tasks, _LOAD_TASKS_SQL)
 
-    async def _get_project_id(self, project_name: str) -> int:
+    def _get_project_id(self, project_name: str) -> int:
         """Get project ID by name.
 
+        Ids are cached per name since a project keeps its id once created;
+        unknown names are not cached so projects added later are still found.
+
         Args:
             project_name: Name of the project
 
@@ -96,11 +199,24 @@ class TaskStore:
         Raises:
             ProjectNotFoundError: If project is not found
         """
-        query = "SELECT id FROM projects WHERE name = ?"
-        project = db.fetch_one(query, (project_name,))
-        if not project:
-            raise ProjectNotFoundError(f"Project '{project_name}' not found")
-        return project["id"]
+        project_id = self._project_ids.get(project_name)
+        if project_id is None:
+            project = get_db().fetch_one(_GET_PROJECT_ID_SQL, (project_name,))
+            if not project:
+                raise ProjectNotFoundError(f"Project '{project_name}' not found")
+            project_id = self._project_ids[project_name] = project["id"]
+        return project_id
+
+    def invalidate_project_cache(self, project_name: Optional[str] = None) -> None:
+        """Forget cached project ids, e.g. after a project is renamed or deleted.
+
+        Args:
+            project_name: Project to forget, or None to clear the whole cache
+        """
+        if project_name is None:
+            self._project_ids.clear()
+        else:
+            self._project_ids.pop(project_name, None)
 
     async def add_task(
         self,
@@ -136,48 +252,89 @@ class TaskStore:
             return {"error": validation_error}
 
         now = datetime.now().isoformat()
-        task = {
-            "title": title.strip(),
-            "description": description.strip(),
-            "completed": False,
-            "priority": str(priority_value),
-            "created_at": now,
-            "modified_at": now,
-            "due_date": due_date if due_date and due_date.strip() else None,
-        }
+        title = title.strip()
+        description = description.strip()
+        priority_value = str(priority_value)
+        due_date = due_date if due_date and due_date.strip() else None
 
         try:
-            project_id = await self._get_project_id(project)
-            task_id = db.execute(
-                """
-                INSERT INTO tasks (
-                    title, description, completed, priority,
-                    created_at, modified_at, due_date, project_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task["title"],
-                    task["description"],
-                    task["completed"],
-                    task["priority"],
-                    task["created_at"],
-                    task["modified_at"],
-                    task["due_date"],
-                    project_id,
-                ),
-            ).lastrowid
+            project_id = self._get_project_id(project)
+            # Bind the locals positionally; the task dict is only built for the result
+            task_id, _ = await asyncio.to_thread(
+                get_db().execute,
+                _INSERT_TASK_SQL,
+                (title, description, False, priority_value, now, now, due_date, project_id),
+            )
 
             if task_id is None:
                 return {"error": "Failed to insert task: no row ID returned"}
 
-            task["id"] = task_id
-            task["project_id"] = project_id
-            task["project_name"] = project
-            return task
+            return {
+                "title": title,
+                "description": description,
+                "completed": False,
+                "priority": priority_value,
+                "created_at": now,
+                "modified_at": now,
+                "due_date": due_date,
+                "id": task_id,
+                "project_id": project_id,
+                "project_name": project,
+            }
 
         except Exception as e:
             return {"error": f"Database error: {str(e)}"}
 
+    async def add_tasks_bulk(self, tasks: List[Dict]) -> Dict:
+        """Add several tasks in one transaction, e.g. for imports or seeding.
+
+        Every task is validated before anything is written, so either all of
+        them are added or none are.
+
+        Args:
+            tasks: Task dicts with a `title` and optional `description`,
+                `priority`, `due_date` and `project` (same meaning as in `add_task`)
+
+        Returns:
+            Dictionary with the number of tasks added under "count", or error message
+        """
+        now = datetime.now().isoformat()
+        rows = []
+        try:
+            for task in tasks:
+                title = task.get("title") or ""
+                description = task.get("description") or ""
+                due_date = task.get("due_date")
+                priority = task.get("priority", Priority.MEDIUM)
+                # Priority is a plain str subclass, so the value has to be checked by hand
+                if not isinstance(priority, str) or priority.lower() not in Priority.values():
+                    return {"error": f"Invalid priority value: {priority}"}
+                priority_value = priority.lower()
+
+                validation_error = self.validate_task(title, description, due_date)
+                if validation_error:
+                    return {"error": f"{title!r}: {validation_error}"}
+
+                rows.append(
+                    (
+                        title.strip(),
+                        description.strip(),
+                        False,
+                        priority_value,
+                        now,
+                        now,
+                        due_date if due_date and due_date.strip() else None,
+                        self._get_project_id(task.get("project", "Inbox")),
+                    )
+                )
+
+            return {"count": await asyncio.to_thread(get_db().execute_many, _INSERT_TASK_SQL, rows)}
+
+        except ProjectNotFoundError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            return {"error": f"Database error: {str(e)}"}
+
     async def toggle_completion(self, task_id: int) -> Dict:
         """Toggle task completion status.
 
@@ -188,17 +345,11 @@ class TaskStore:
             Updated task data or error message
         """
         try:
-            task = await self.get_task_by_id(task_id)
-            completed = not task["completed"]
-            modified_at = datetime.now().isoformat()
-
-            db.execute(
-                "UPDATE tasks SET completed = ?, modified_at = ? WHERE id = ?",
-                (completed, modified_at, task_id),
+            task = await asyncio.to_thread(
+                self._write_task, _TOGGLE_COMPLETED_SQL, (datetime.now().isoformat(), task_id)
             )
-
-            task["completed"] = completed
-            task["modified_at"] = modified_at
+            if task is None:
+                raise TaskNotFoundError(f"Task with ID {task_id} not found")
             return task
 
         except TaskNotFoundError as e:
@@ -229,53 +380,37 @@ class TaskStore:
             Updated task data or error message
         """
         try:
-            task = await self.get_task_by_id(task_id)
-
             validation_error = self.validate_task(title, description, due_date)
             if validation_error:
                 return {"error": validation_error}
 
+            # None leaves the stored priority/project unchanged (see COALESCE)
+            priority_value = None
             if priority is not None:
                 if isinstance(priority, str):
                     try:
                         priority = Priority(priority.lower())
                     except ValueError:
                         return {"error": f"Invalid priority value: {priority}"}
-                task["priority"] = priority.value
-
-            task.update(
-                {
-                    "title": title.strip(),
-                    "description": description.strip(),
-                    "due_date": due_date if due_date and due_date.strip() else None,
-                    "modified_at": datetime.now().isoformat(),
-                }
-            )
+                priority_value = priority.value
 
-            project_id = None
-            if project is not None and project != task.get("project_name"):
-                project_id = await self._get_project_id(project)
-                task["project_id"] = project_id
-                task["project_name"] = project
-
-            db.execute(
-                """
-                UPDATE tasks 
-                SET title=?, description=?, due_date=?, modified_at=?, 
-                    priority=?, project_id=COALESCE(?, project_id)
-                WHERE id=?
-                """,
+            project_id = self._get_project_id(project) if project is not None else None
+
+            task = await asyncio.to_thread(
+                self._write_task,
+                _UPDATE_TASK_SQL,
                 (
-                    task["title"],
-                    task["description"],
-                    task["due_date"],
-                    task["modified_at"],
-                    task["priority"],
+                    title.strip(),
+                    description.strip(),
+                    due_date if due_date and due_date.strip() else None,
+                    datetime.now().isoformat(),
+                    priority_value,
                     project_id,
                     task_id,
                 ),
             )
-
+            if task is None:
+                raise TaskNotFoundError(f"Task with ID {task_id} not found")
             return task
 
         except (TaskNotFoundError, ProjectNotFoundError) as e:
@@ -293,12 +428,67 @@ class TaskStore:
             True if task was deleted, False otherwise
         """
         try:
-            await self.get_task_by_id(task_id)  # Verify task exists
-            db.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-            return True
-        except (TaskNotFoundError, Exception):
+            # No row deleted means the task did not exist
+            _, rowcount = await asyncio.to_thread(get_db().execute, _DELETE_TASK_SQL, (task_id,))
+            return rowcount > 0
+        except Exception:
             return False
 
+    def _write_task(self, query: str, params: Tuple[Any, ...]) -> Optional[Dict]:
+        """Run a single-task UPDATE and return the task as stored afterwards.
+
+        With RETURNING support this is one round trip; otherwise the task is
+        read back after the write.
+
+        Args:
+            query: UPDATE statement whose last parameter is the task id
+            params: Query parameters
+
+        Returns:
+            Updated task data, or None if no task has that id
+        """
+        db = get_db()
+        if SUPPORTS_RETURNING:
+            row = db.execute_returning(_returning_sql(query), params)
+        elif db.execute(query, params)[1]:
+            row = db.fetch_one(_GET_TASK_SQL, (params[-1],))
+        else:
+            row = None
+        return self._format_task(row) if row else None
+
+    async def bulk_toggle(self, task_ids: List[int]) -> int:
+        """Toggle the completion status of several tasks in one transaction.
+
+        Args:
+            task_ids: IDs of the tasks to toggle
+
+        Returns:
+            Number of tasks toggled, or 0 on a database error
+        """
+        modified_at = datetime.now().isoformat()
+        try:
+            return await asyncio.to_thread(
+                get_db().execute_many, _TOGGLE_COMPLETED_SQL, [(modified_at, task_id) for task_id in task_ids]
+            )
+        except Exception:
+            return 0
+
+    async def bulk_delete(self, task_ids: List[int]) -> int:
+        """Delete several tasks in one transaction.
+
+        Args:
+            task_ids: IDs of the tasks to delete
+
+        Returns:
+            Number of tasks deleted, or 0 on a database error
+        """
+        try:
+            return await asyncio.to_thread(
+                get_db().execute_many, _DELETE_TASK_SQL, [(task_id,) for task_id in task_ids]
+            )
+        except Exception:
+            return 0
+
     async def get_task_by_id(self, task_id: int) -> Dict:
         """Get a task by ID.
 
@@ -311,13 +501,7 @@ class TaskStore:
         Raises:
             TaskNotFoundError: If task is not found
         """
-        query = """
-            SELECT tasks.*, projects.name AS project_name
-            FROM tasks
-            JOIN projects ON tasks.project_id = projects.id
-            WHERE tasks.id = ?
-        """
-        task = db.fetch_one(query, (task_id,))
+        task = get_db().fetch_one(_GET_TASK_SQL, (task_id,))
         if not task:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
         return self._format_task(task)
@@ -342,8 +526,14 @@ class TaskStore:
         params = []
 
         if query:
-            conditions.append("(title LIKE ? OR description LIKE ?)")
-            params.extend([f"%{query}%", f"%{query}%"])
+            # Trigrams need at least 3 characters; shorter terms fall back to LIKE
+            if SUPPORTS_FTS and len(query) >= 3:
+                conditions.append("id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)")
+                # Quote the term as a single phrase so FTS5 syntax in it is matched literally
+                params.append('"{}"'.format(query.replace('"', '""')))
+            else:
+                conditions.append("(title LIKE ? OR description LIKE ?)")
+                params.extend([f"%{query}%", f"%{query}%"])
 
         if priority is not None:
             if isinstance(priority, str):
@@ -358,19 +548,10 @@ class TaskStore:
             conditions.append("completed = ?")
             params.append(completed)
 
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-
-        query = f"""
-            SELECT tasks.*, projects.name AS project_name
-            FROM tasks
-            JOIN projects ON tasks.project_id = projects.id
-            {where_clause}
-            ORDER BY tasks.completed, tasks.due_date, tasks.created_at
-        """
+        query = _search_sql(tuple(conditions))
 
         try:
-            rows = db.fetch_all(query, tuple(params))
-            return [self._format_task(row) for row in rows]
+            return self._fetch_tasks(query, tuple(params))
         except Exception as e:
             print(f"Error searching tasks: {e}")
             return []
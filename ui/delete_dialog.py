@@ -14,6 +14,8 @@ class DeleteConfirmDialog(ModalScreen):
     class Delete(Message):
         """Message sent when the user confirms deletion."""
 
+        __slots__ = ("task_id",)
+
         def __init__(self, task_id: int):
             """Initialize the Delete message.
 
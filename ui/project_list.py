@@ -1,10 +1,16 @@
 """Project list widget implementation."""
 
-from typing import Any, Dict, List
+import asyncio
+from bisect import insort
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 from textual.widgets import Label, ListItem, ListView
 
-from database import db
+from database import get_db
+
+_LOAD_PROJECTS_SQL = "SELECT id, name FROM projects ORDER BY name"
+_INSERT_PROJECT_SQL = "INSERT INTO projects (name) VALUES (?)"
 
 
 class ProjectList(ListView):
@@ -15,25 +21,48 @@ class ProjectList(ListView):
         self.border_title = "Projects"
         self.id = "project-list"
         self.projects: List[Dict[str, Any]] = []
+        # Project id -> the row showing it, so refreshes only touch changed rows
+        self._items: Dict[int, ListItem] = {}
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Load projects when the list is mounted."""
-        await self.load_projects()
+        # Let the list paint empty and fill it in once the query returns
+        self.run_worker(self.load_projects(), exclusive=True)
 
     async def load_projects(self) -> None:
         """Load projects from the database."""
         try:
-            rows = db.fetch_all("SELECT id, name FROM projects ORDER BY name")
+            rows = await asyncio.to_thread(get_db().fetch_all, _LOAD_PROJECTS_SQL)
             self.projects = rows
             self.refresh_projects()
         except Exception as e:
             self.notify(f"Failed to load projects: {e}", severity="error")
 
     def refresh_projects(self) -> None:
-        """Refresh the project list view."""
-        self.clear()
-        for project in self.projects:
-            self.append(ListItem(Label(project["name"].title(), classes="project-label")))
+        """Refresh the project list view.
+
+        Rows are kept per project id, so only added or removed projects mount or
+        remove widgets; unchanged rows are left alone.
+        """
+        items = self._items
+        project_ids = {project["id"] for project in self.projects}
+
+        # Drop the rows of projects that no longer exist
+        stale = {items.pop(project_id) for project_id in items.keys() - project_ids}
+        if stale:
+            self.remove_items([index for index, item in enumerate(self.children) if item in stale])
+
+        # Walk backwards so each new row can be mounted before its successor
+        next_item: Optional[ListItem] = None
+        for project in reversed(self.projects):
+            item = items.get(project["id"])
+            if item is None:
+                item = items[project["id"]] = ListItem(Label(project["name"].title(), classes="project-label"))
+                if next_item is None:
+                    self.append(item)
+                else:
+                    self.mount(item, before=next_item)
+            next_item = item
 
     async def add_project(self, name: str) -> bool:
         """Add a new project.
@@ -45,9 +74,31 @@ class ProjectList(ListView):
             bool: True if project was added, False otherwise
         """
         try:
-            db.execute("INSERT INTO projects (name) VALUES (?)", (name,))
-            await self.load_projects()
+            project_id, _ = await asyncio.to_thread(get_db().execute, _INSERT_PROJECT_SQL, (name,))
+            # Slot the new project into the sorted list instead of reloading them all
+            insort(self.projects, {"id": project_id, "name": name}, key=itemgetter("name"))
+            self.refresh_projects()
             return True
         except Exception as e:
             self.notify(f"Failed to add project: {e}", severity="error")
             return False
+
+    async def add_projects(self, names: List[str]) -> bool:
+        """Add several projects in one transaction, e.g. for imports.
+
+        Either all of the projects are added or none are.
+
+        Args:
+            names: Names of the projects to add
+
+        Returns:
+            bool: True if the projects were added, False otherwise
+        """
+        try:
+            await asyncio.to_thread(get_db().execute_many, _INSERT_PROJECT_SQL, [(name,) for name in names])
+            # executemany reports no row ids, so read the projects back in one query
+            await self.load_projects()
+            return True
+        except Exception as e:
+            self.notify(f"Failed to add projects: {e}", severity="error")
+            return False
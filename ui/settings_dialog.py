@@ -8,6 +8,21 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Select
 
+# Available themes as (label, value) options, shared by every dialog instance
+THEMES = (
+    ("textual-dark", "textual-dark"),
+    ("textual-light", "textual-light"),
+    ("nord", "nord"),
+    ("gruvbox", "gruvbox"),
+    ("dracula", "dracula"),
+    ("tokyo-night", "tokyo-night"),
+    ("monokai", "monokai"),
+    ("flexoki", "flexoki"),
+    ("catppuccin-mocha", "catppuccin-mocha"),
+    ("catppuccin-latte", "catppuccin-latte"),
+    ("solarized-light", "solarized-light"),
+)
+
 
 @dataclass
 class ThemeChanged(events.Event):
@@ -19,21 +34,6 @@ class ThemeChanged(events.Event):
 class SettingsDialog(ModalScreen):
     """Dialog for application settings."""
 
-    # Available themes
-    selectThemeList = [
-        ("textual-dark", "textual-dark"),
-        ("textual-light", "textual-light"),
-        ("nord", "nord"),
-        ("gruvbox", "gruvbox"),
-        ("dracula", "dracula"),
-        ("tokyo-night", "tokyo-night"),
-        ("monokai", "monokai"),
-        ("flexoki", "flexoki"),
-        ("catppuccin-mocha", "catppuccin-mocha"),
-        ("catppuccin-latte", "catppuccin-latte"),
-        ("solarized-light", "solarized-light"),
-    ]
-
     def compose(self) -> ComposeResult:
         """Compose the dialog UI."""
         with Vertical(id="settings-dialog"):
@@ -41,7 +41,7 @@ class SettingsDialog(ModalScreen):
 
             # Theme selection
             theme_select = Select(
-                self.selectThemeList,
+                THEMES,
                 id="theme-select",
                 value=self.app.dark_theme if hasattr(self.app, "dark_theme") else "textual-dark",
             )
@@ -1,15 +1,33 @@
 """Task list widget implementation using DataTable."""
 
+from functools import lru_cache
 from typing import Optional
 
 from rich.text import Text
 from textual import events, on
 from textual.app import ComposeResult
 from textual.containers import Container
+from textual.coordinate import Coordinate
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import DataTable
+from textual.widgets.data_table import RowDoesNotExist
+
+
+@lru_cache(maxsize=4096)
+def _build_row_cells(title: str, description: str, due_date: str, completed: bool) -> tuple:
+    """Build the cells for a task row, memoized on the displayed fields.
+
+    The arguments fully determine the output, so cached rows are reused across
+    reloads and never go stale.
+    """
+    # Create styled text for title with strikethrough if completed
+    title_text = Text(title)
+    if completed:
+        title_text.stylize("strike")
+
+    return (title_text, description, due_date, "✅" if completed else "⏳")
 
 
 class TaskList(Container):
@@ -48,49 +66,100 @@ class TaskList(Container):
     def update_table(self, tasks: list[dict], focus_task_id: Optional[int] = None) -> None:
         """Update the table with the given tasks.
 
+        When the tasks are the same rows in the same order, only the cells that
+        changed are redrawn; otherwise the table is rebuilt.
+
         Args:
             tasks: List of task dictionaries
             focus_task_id: Optional task ID to focus after update
         """
+        same_rows = [task["id"] for task in self.tasks] == [task["id"] for task in tasks]
         self.tasks = tasks
         table = self.query_one(DataTable)
 
         # Store current scroll position
         scroll_x, scroll_y = table.scroll_x, table.scroll_y
 
-        # Clear and repopulate the table
-        table.clear()
-
-        # Add tasks to the table
-        for task in tasks:
-            # Determine status text and style
-            status = "✅" if task.get("completed", False) else "⏳"
-
-            # Create styled text for title with strikethrough if completed
-            title_text = Text(task.get("title", ""))
-            if task.get("completed", False):
-                title_text.stylize("strike")
-
-            # Add row to table
-            row_key = str(task["id"])
-            table.add_row(
-                title_text,
-                task.get("description", ""),
-                task.get("due_date", ""),
-                status,
-                key=row_key,
-            )
+        # Hold screen updates until every row, the cursor and the scroll position are final
+        with self.app.batch_update():
+            if same_rows:
+                for index, task in enumerate(tasks):
+                    self.update_row(index, task)
+            else:
+                # Clear and repopulate the table
+                table.clear()
+
+                # Add tasks to the table in one tight loop
+                add_row = table.add_row
+                row_cells = self._row_cells
+                for task in tasks:
+                    add_row(*row_cells(task), key=str(task["id"]))
 
             # Focus the specified task if it exists
-            if focus_task_id is not None and task["id"] == focus_task_id:
+            if focus_task_id is not None:
                 try:
-                    table.cursor_coordinate = (table.get_row_index(row_key), 0)
+                    table.cursor_coordinate = (table.get_row_index(str(focus_task_id)), 0)
                     table.focus()
-                except NoMatches:
+                except RowDoesNotExist:
                     pass
 
-        # Restore scroll position
-        table.scroll_to(scroll_x, scroll_y)
+            # Restore scroll position
+            table.scroll_to(scroll_x, scroll_y)
+
+    @staticmethod
+    def _row_cells(task: dict) -> tuple:
+        """Build the cell values displayed for a task row.
+
+        Args:
+            task: Task dictionary
+
+        Returns:
+            tuple: Title, description, due date and status cells
+        """
+        return _build_row_cells(
+            task.get("title", ""),
+            task.get("description", ""),
+            task.get("due_date", ""),
+            task.get("completed", False),
+        )
+
+    def update_row(self, index: int, task: dict) -> None:
+        """Redraw the changed cells of a single row in place.
+
+        The caller is responsible for storing `task` at `index` in `tasks`.
+
+        Args:
+            index: Row index of the task
+            task: Updated task dictionary
+        """
+        table = self.query_one(DataTable)
+        current = table.get_row_at(index)
+        for column, (old, new) in enumerate(zip(current, self._row_cells(task))):
+            # Skip unchanged cells so only the edited columns are re-rendered
+            if old != new:
+                table.update_cell_at(Coordinate(index, column), new)
+
+    def append_row(self, task: dict) -> None:
+        """Add a row for a new task and move the cursor to it.
+
+        The caller is responsible for appending `task` to `tasks`.
+
+        Args:
+            task: Task dictionary to add
+        """
+        table = self.query_one(DataTable)
+        row_key = table.add_row(*self._row_cells(task), key=str(task["id"]))
+        table.cursor_coordinate = Coordinate(table.get_row_index(row_key), 0)
+
+    def remove_row(self, task_id: int) -> None:
+        """Remove the row for a deleted task.
+
+        The caller is responsible for removing the task from `tasks`.
+
+        Args:
+            task_id: ID of the deleted task
+        """
+        self.query_one(DataTable).remove_row(str(task_id))
 
     def get_selected_task_id(self) -> Optional[int]:
         """Get the ID of the currently selected task.
@@ -117,17 +186,11 @@ class TaskList(Container):
     @on(DataTable.RowSelected)
     def on_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in the table."""
-        if event.row_key is not None and event.row_key.value is not None:
-            try:
-                task_id = int(str(event.row_key.value))
-                task = next((t for t in self.tasks if t["id"] == task_id), None)
-                if task:
-                    self.post_message(self.Selected(task))
-                    # Update focus state
-                    self.has_focus = True
-            except (ValueError, AttributeError):
-                # Skip if the row_key value can't be converted to an int
-                pass
+        # Rows mirror self.tasks, so the selected row indexes the task directly
+        if 0 <= event.cursor_row < len(self.tasks):
+            self.post_message(self.Selected(self.tasks[event.cursor_row]))
+            # Update focus state
+            self.has_focus = True
 
     def on_focus(self, event: events.Focus) -> None:
         """Handle focus events on the task list."""
@@ -152,6 +215,8 @@ class TaskList(Container):
     class Selected(Message):
         """Message sent when a task is selected in the table."""
 
+        __slots__ = ("task",)
+
         def __init__(self, task: dict):
             super().__init__()
             self.task = task
@@ -1,21 +1,42 @@
 """Task view widget implementation."""
 
+from functools import lru_cache
 from typing import Optional
 
 from textual import events, on
 from textual.app import ComposeResult
+from textual.color import Color
 from textual.containers import Vertical
 from textual.message import Message
 from textual.reactive import reactive
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Input, Label
 
+from config import AUTOSAVE_DEBOUNCE
+
 from .task_types import TaskData
 
+# Status text and color for incomplete/completed tasks; colors are parsed once here
+# rather than from a string on every update
+_STATUS = {
+    False: ("⏳ Pending", Color.parse("yellow")),
+    True: ("✅ Completed", Color.parse("green")),
+}
+
+
+@lru_cache(maxsize=256)
+def _project_label(name: str) -> str:
+    """Title-case a project name for display; there are only a handful of distinct names."""
+    return name.title()
+
 
 class TaskView(Vertical):
     """View for displaying additional task information and making quick edits."""
 
     class Save(Message):
+        __slots__ = ("task",)
+
         def __init__(self, task: TaskData):
             self.task = task
             super().__init__()
@@ -28,34 +49,43 @@ class TaskView(Vertical):
         self.selected_task: Optional[TaskData] = None
         self.has_focus = reactive(False)
         self._is_editing = False
+        # Pending auto-save of the selected task, see on_input_changed
+        self._save_timer: Optional[Timer] = None
+        # The app's task list, looked up on the first Esc
+        self._task_list: Optional[Widget] = None
 
     def compose(self) -> ComposeResult:
         """Compose the task view UI."""
+        # Inputs are kept as attributes so handlers don't have to query the DOM
         with Vertical(id="task-details"):
             # Task title
-            title_input = Input(id="task-view-title", placeholder="Task title")
+            title_input = self._title_input = Input(id="task-view-title", classes="editable", placeholder="Task title")
             title_input.border_title = "Title"
             title_input.tooltip = "Press Enter to save changes"
             yield title_input
 
             # Due date
-            due_date = Input(id="task-view-due-date", placeholder="YYYY-MM-DD")
+            due_date = self._due_date_input = Input(
+                id="task-view-due-date", classes="editable", placeholder="YYYY-MM-DD"
+            )
             due_date.border_title = "Due Date"
             due_date.tooltip = "Format: YYYY-MM-DD"
             yield due_date
 
             # Project
-            project_input = Input(id="task-view-project", disabled=True)
+            project_input = self._project_input = Input(id="task-view-project", disabled=True)
             project_input.border_title = "Project"
             yield project_input
 
             # Status
-            status_input = Input(id="task-view-status", disabled=True)
+            status_input = self._status_input = Input(id="task-view-status", disabled=True)
             status_input.border_title = "Status"
             yield status_input
 
             # Task description
-            desc_input = Input(id="task-view-desc", placeholder="Task description")
+            desc_input = self._desc_input = Input(
+                id="task-view-desc", classes="editable", placeholder="Task description"
+            )
             desc_input.border_title = "Description"
             desc_input.tooltip = "Press Enter or click outside to save"
             yield desc_input
@@ -70,75 +100,102 @@ class TaskView(Vertical):
         Args:
             task: The task data to display, or None to clear the view
         """
+        # Save edits still waiting on the debounce before the inputs are replaced
+        self._flush_save()
+        # Reselecting the task already shown would rewrite every input for nothing,
+        # unless they still hold edits that were never saved (e.g. a rejected due date)
+        if task is not None and task == self.selected_task:
+            shown = (task.get("title", ""), task.get("description") or "", task.get("due_date") or "")
+            if self._read_fields() == shown:
+                return
         self.selected_task = task
 
         # Get all input fields
-        title_input = self.query_one("#task-view-title", Input)
-        desc_input = self.query_one("#task-view-desc", Input)
-        due_date = self.query_one("#task-view-due-date", Input)
-        project_input = self.query_one("#task-view-project", Input)
-        status_input = self.query_one("#task-view-status", Input)
-
-        if task:
-            # Update fields with task data
-            title_input.value = task.get("title", "")
-            desc_input.value = task.get("description") or ""
-            due_date.value = task.get("due_date") or ""
-            project_input.value = task.get("project_name", "Inbox").title()
-
-            # Set status
-            status = "✅ Completed" if task.get("completed", False) else "⏳ Pending"
-            status_input.value = status
-
-            # Style based on completion status
-            status_input.styles.color = "green" if task.get("completed", False) else "yellow"
-
-            # Update border title to show task title
-            self.border_title = f"[bold]Task: {task.get('title', 'Untitled')}[/]"
-        else:
-            # Clear all fields
-            title_input.value = ""
-            desc_input.value = ""
-            due_date.value = ""
-            project_input.value = ""
-            status_input.value = ""
-            self.border_title = "[dim]No task selected[/]"
+        title_input = self._title_input
+        desc_input = self._desc_input
+        due_date = self._due_date_input
+        project_input = self._project_input
+        status_input = self._status_input
+
+        # The new values match the task, so there is nothing for on_input_changed to save
+        with self.prevent(Input.Changed):
+            if task:
+                # Update fields with task data
+                title_input.value = task.get("title", "")
+                desc_input.value = task.get("description") or ""
+                due_date.value = task.get("due_date") or ""
+                project_input.value = _project_label(task.get("project_name", "Inbox"))
+
+                # Set status, styled by completion
+                status_input.value, status_input.styles.color = _STATUS[bool(task.get("completed", False))]
+
+                # Update border title to show task title
+                self.border_title = f"[bold]Task: {task.get('title', 'Untitled')}[/]"
+            else:
+                # Clear all fields
+                title_input.value = ""
+                desc_input.value = ""
+                due_date.value = ""
+                project_input.value = ""
+                status_input.value = ""
+                self.border_title = "[dim]No task selected[/]"
 
         # If we're not currently editing, focus the title input
         if not self._is_editing and task:
             title_input.focus()
 
-        self.refresh()
-
-    @on(Input.Changed, "#task-view-title,#task-view-desc,#task-view-due-date")
+    @on(Input.Changed, ".editable")
     def on_input_changed(self, event: Input.Changed) -> None:
-        title = self.query_one("#task-view-title", Input).value.strip()
-        description = self.query_one("#task-view-desc", Input).value.strip()
-        due_date = self.query_one("#task-view-due-date", Input).value.strip()
         if self.selected_task is None:
             # Do not auto-save for new tasks on change
             return
-        orig_title = self.selected_task.get("title", "").strip()
-        orig_description = (self.selected_task.get("description") or "").strip()
-        orig_due_date = (self.selected_task.get("due_date") or "").strip()
+        # Every keystroke lands here, so save once typing pauses for AUTOSAVE_DEBOUNCE
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(AUTOSAVE_DEBOUNCE, self._flush_save)
+
+    def _read_fields(self) -> tuple[str, str, str]:
+        """Read the editable inputs.
+
+        Returns:
+            tuple: Unstripped title, description and due date values
+        """
+        return self._title_input.value, self._desc_input.value, self._due_date_input.value
+
+    def _flush_save(self) -> None:
+        """Post a Save for the selected task if an auto-save is pending and the inputs changed it."""
+        if self._save_timer is None:
+            return
+        self._save_timer.stop()
+        self._save_timer = None
+        task = self.selected_task
+        if task is None:
+            return
+        orig_title = task.get("title", "")
+        orig_description = task.get("description") or ""
+        orig_due_date = task.get("due_date") or ""
+        title, description, due_date = self._read_fields()
+        # Check the raw values first; only strip when something differs
         if title == orig_title and description == orig_description and due_date == orig_due_date:
-            return  # No changes, do not post Save
-        task_data: TaskData = {
-            **self.selected_task,
+            return
+        title, description, due_date = title.strip(), description.strip(), due_date.strip()
+        if (title, description, due_date) == (orig_title.strip(), orig_description.strip(), orig_due_date.strip()):
+            return  # Only whitespace changed, do not post Save
+        task_data: TaskData = task | {
             "title": title,
             "description": description if description else None,
             "due_date": due_date if due_date else None,
         }
         self.post_message(self.Save(task_data))
 
-    @on(Input.Submitted, "#task-view-title,#task-view-desc,#task-view-due-date")
-    @on(Input.Blurred, "#task-view-title,#task-view-desc,#task-view-due-date")
+    @on(Input.Submitted, ".editable")
+    @on(Input.Blurred, ".editable")
     def on_input_submitted_or_blurred(self, event: Input.Submitted | Input.Blurred) -> None:
         if self.selected_task is not None:
-            return  # Only handle new tasks here
-        title = self.query_one("#task-view-title", Input).value.strip()
-        description = self.query_one("#task-view-desc", Input).value.strip()
-        due_date = self.query_one("#task-view-due-date", Input).value.strip()
+            # Existing tasks auto-save on change; don't wait out the debounce on Enter or blur
+            self._flush_save()
+            return
+        title, description, due_date = (value.strip() for value in self._read_fields())
         if title:
             task_data: TaskData = {
                 "title": title,
@@ -150,16 +207,17 @@ class TaskView(Vertical):
 
     def clear_and_focus(self) -> None:
         """Clear all input fields and focus the title input for new task creation."""
+        self._flush_save()
         self.selected_task = None
         self._is_editing = True
         self.add_class("editing")
 
         # Clear all fields
-        title_input = self.query_one("#task-view-title", Input)
-        desc_input = self.query_one("#task-view-desc", Input)
-        due_date = self.query_one("#task-view-due-date", Input)
-        project_input = self.query_one("#task-view-project", Input)
-        status_input = self.query_one("#task-view-status", Input)
+        title_input = self._title_input
+        desc_input = self._desc_input
+        due_date = self._due_date_input
+        project_input = self._project_input
+        status_input = self._status_input
 
         title_input.value = ""
         desc_input.value = ""
@@ -169,7 +227,6 @@ class TaskView(Vertical):
 
         # Update UI
         self.border_title = "[bold]New Task[/]"
-        self.refresh()
 
         # Focus the title input
         title_input.focus()
@@ -203,8 +260,9 @@ class TaskView(Vertical):
             # Return focus to the task list
             self._is_editing = False
             self.remove_class("editing")
-            task_list = self.app.query_one("#task-list")
-            task_list.focus()
+            if self._task_list is None:
+                self._task_list = self.app.query_one("#task-list")
+            self._task_list.focus()
             event.stop()
         elif event.key == "enter" and event.control.id in ("task-view-title", "task-view-desc", "task-view-due-date"):
             # Save on Enter in any input field